@@ -6,6 +6,7 @@ from typing import Optional
 import requests
 
 from config import CHAT_API_KEY
+from rate_governor import governed_request
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +60,9 @@ Format it as a brief news summary suitable for a daily digest."""
         }
         
         logger.info("Generating news overview using chat API...")
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = governed_request(
+            "openai", "POST", url, json=payload, headers=headers, timeout=30
+        )
         response.raise_for_status()
         
         data = response.json()
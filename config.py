@@ -38,3 +38,9 @@ TELEGRAM_CHAT_ID = get_env_var("TELEGRAM_CHAT_ID", required=False) or ""
 # Chat API configuration (for fallback news overview)
 CHAT_API_KEY = get_env_var("CHAT_API_KEY", required=False) or ""
 
+
+# Digest store configuration (daily summaries used for weekly/monthly roll-ups)
+DIGEST_STORE_DIR = get_env_var("DIGEST_STORE_DIR", required=False) or "data/daily"
+
+# Rate governor configuration (per-provider budgets persisted across runs)
+RATE_STATE_PATH = get_env_var("RATE_STATE_PATH", required=False) or "data/rate_limits.json"
@@ -0,0 +1,185 @@
+"""Storage of pre-aggregated daily news summaries for roll-up digests."""
+
+import json
+import logging
+import os
+import re
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Set
+
+from config import DIGEST_STORE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Longest description any formatter shows; anything beyond is never rendered
+MAX_STORED_DESCRIPTION = 300
+
+# Summaries older than this are deleted; the longest roll-up (the previous
+# calendar month, sent on the 1st) reaches back at most 31 days
+RETENTION_DAYS = 31
+
+# Two titles describe the same story when this share of the shorter title's
+# words (and at least MIN_SHARED_WORDS of them) also appear in the other one
+TITLE_OVERLAP = 0.6
+MIN_SHARED_WORDS = 3
+
+_STOPWORDS = {
+    "a", "an", "and", "as", "at", "by", "for", "from", "in", "into", "is",
+    "it", "of", "on", "or", "over", "says", "the", "to", "with",
+}
+
+
+def title_words(title: str) -> Set[str]:
+    """Normalize a headline to its set of significant lowercase words."""
+    words = re.findall(r"\w+", title.lower())
+    return {w for w in words if len(w) > 1 and w not in _STOPWORDS}
+
+
+def same_story(words_a: Set[str], words_b: Set[str]) -> bool:
+    """Return True if two normalized headlines most likely report the same story."""
+    if not words_a or not words_b:
+        return False
+    shared = len(words_a & words_b)
+    return shared >= MIN_SHARED_WORDS and shared / min(len(words_a), len(words_b)) >= TITLE_OVERLAP
+
+
+def score_articles(articles: List[Dict]) -> List[Dict]:
+    """
+    Group a day's articles into stories and score them by coverage.
+
+    Articles whose headlines match (see same_story) are counted as one story,
+    so a story reported by five outlets scores 5 and a one-off article scores 1.
+    The first (newest) article of a story provides its title, description and url.
+
+    Args:
+        articles: List of article dictionaries as returned by the news client
+
+    Returns:
+        List of story dicts: title, description, url, published_at, score, words
+    """
+    stories: List[Dict] = []
+    for article in articles:
+        title = (article.get("title") or "No title").strip()
+        words = title_words(title)
+
+        match = next((s for s in stories if same_story(s["words"], words)), None)
+        if match:
+            match["score"] += 1
+            continue
+
+        description = (article.get("description") or "").strip()
+        stories.append(
+            {
+                "title": title,
+                "description": description[:MAX_STORED_DESCRIPTION],
+                "url": (article.get("url") or "").strip(),
+                "published_at": article.get("published_at", ""),
+                "score": 1,
+                "words": words,
+            }
+        )
+
+    # Sets are not JSON serializable
+    return [{**s, "words": sorted(s["words"])} for s in stories]
+
+
+def _summary_path(day: date, store_dir: Optional[str] = None) -> str:
+    """Return the file path of the summary for the given day."""
+    return os.path.join(store_dir or DIGEST_STORE_DIR, f"{day.isoformat()}.json")
+
+
+def save_daily_summary(
+    articles: List[Dict], day: Optional[date] = None, store_dir: Optional[str] = None
+) -> str:
+    """
+    Score a day's articles and store them as a small daily summary.
+
+    Running again on the same day replaces that day's summary. Summaries
+    older than RETENTION_DAYS are deleted.
+
+    Args:
+        articles: List of article dictionaries fetched for the day
+        day: Day the articles belong to (defaults to today)
+        store_dir: Optional directory (defaults to DIGEST_STORE_DIR from config)
+
+    Returns:
+        Path of the written summary file
+    """
+    day = day or date.today()
+    path = _summary_path(day, store_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    summary = {
+        "date": day.isoformat(),
+        "stories": score_articles(articles),
+    }
+
+    # Write to a temp file first so a crash never leaves a half-written summary
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+    logger.info(f"Stored daily summary with {len(summary['stories'])} stories at {path}")
+
+    prune_daily_summaries(day, store_dir)
+    return path
+
+
+def prune_daily_summaries(day: Optional[date] = None, store_dir: Optional[str] = None) -> int:
+    """
+    Delete stored summaries older than RETENTION_DAYS.
+
+    Args:
+        day: Day to count back from (defaults to today)
+        store_dir: Optional directory (defaults to DIGEST_STORE_DIR from config)
+
+    Returns:
+        Number of deleted summary files
+    """
+    store_dir = store_dir or DIGEST_STORE_DIR
+    cutoff = (day or date.today()) - timedelta(days=RETENTION_DAYS)
+
+    deleted = 0
+    for name in os.listdir(store_dir):
+        stem, ext = os.path.splitext(name)
+        if ext != ".json":
+            continue
+        try:
+            summary_day = date.fromisoformat(stem)
+        except ValueError:
+            continue
+
+        if summary_day < cutoff:
+            try:
+                os.remove(os.path.join(store_dir, name))
+                deleted += 1
+            except OSError as e:
+                logger.warning(f"Could not delete old daily summary {name}: {e}")
+
+    if deleted:
+        logger.info(f"Deleted {deleted} daily summaries older than {cutoff.isoformat()}")
+    return deleted
+
+
+def load_daily_summary(day: date, store_dir: Optional[str] = None) -> Optional[Dict]:
+    """
+    Load the stored summary for a day.
+
+    Args:
+        day: Day to load
+        store_dir: Optional directory (defaults to DIGEST_STORE_DIR from config)
+
+    Returns:
+        Summary dict with date and stories, or None if missing or unreadable
+    """
+    path = _summary_path(day, store_dir)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read daily summary {path}: {e}")
+        return None
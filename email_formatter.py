@@ -1,39 +1,53 @@
 """Email formatting utilities for news digest."""
 
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
-def build_email_subject() -> str:
+def build_email_subject(heading: Optional[str] = None) -> str:
     """
     Build the email subject line.
     
+    Args:
+        heading: Optional heading to use instead of the daily one
+        
     Returns:
         Subject string like "Your daily Europe news – 2024-01-15"
     """
+    if heading:
+        return f"Your {heading}"
     today = datetime.now().strftime("%Y-%m-%d")
     return f"Your daily Europe news – {today}"
 
 
-def build_email_body_plain(articles: List[Dict]) -> str:
+def _default_heading() -> str:
+    """Return the heading of the daily digest."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    return f"Daily Europe News – {today}"
+
+
+def build_email_body_plain(
+    articles: List[Dict], heading: Optional[str] = None
+) -> str:
     """
     Build plain text email body.
     
     Args:
         articles: List of article dictionaries with title, description, url
+        heading: Optional heading to use instead of the daily one
         
     Returns:
         Plain text email body
     """
-    today = datetime.now().strftime("%Y-%m-%d")
+    heading = heading or _default_heading()
     
     if not articles:
-        return f"""Daily Europe News – {today}
+        return f"""{heading}
 
 No news articles were available today. Please check back tomorrow.
 """
     
-    lines = [f"Daily Europe News – {today}\n"]
+    lines = [f"{heading}\n"]
     lines.append(f"Here are the top {len(articles)} European news stories:\n")
     
     for i, article in enumerate(articles, 1):
@@ -54,17 +68,20 @@ No news articles were available today. Please check back tomorrow.
     return "\n".join(lines)
 
 
-def build_email_body_html(articles: List[Dict]) -> str:
+def build_email_body_html(
+    articles: List[Dict], heading: Optional[str] = None
+) -> str:
     """
     Build HTML email body.
     
     Args:
         articles: List of article dictionaries with title, description, url
+        heading: Optional heading to use instead of the daily one
         
     Returns:
         HTML email body (email-safe, no external CSS)
     """
-    today = datetime.now().strftime("%Y-%m-%d")
+    heading = heading or _default_heading()
     
     html_parts = [
         "<!DOCTYPE html>",
@@ -82,7 +99,7 @@ def build_email_body_html(articles: List[Dict]) -> str:
         "</style>",
         "</head>",
         "<body>",
-        f"<h2>Daily Europe News – {today}</h2>",
+        f"<h2>{heading}</h2>",
     ]
     
     if not articles:
@@ -2,12 +2,15 @@
 
 import logging
 import sys
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
 from config import TELEGRAM_CHAT_ID
 from chat_api_client import generate_news_overview
+from digest_store import save_daily_summary
 from news_client import fetch_top_europe_news
+from rollup import PERIODS, build_rollup, build_rollup_heading
 from telegram_formatter import build_telegram_message
 from telegram_sender import send_telegram_message
 
@@ -21,15 +24,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Articles fetched per daily run for the stored summary; the newest 10 are sent
+SUMMARY_POOL_SIZE = 50
 
-def main() -> None:
-    """Main function to fetch news and send Telegram message."""
+
+def send_rollup(period: str) -> None:
+    """Build a weekly/monthly digest from stored daily summaries and send it."""
+    logger.info(f"Building {period} roll-up digest...")
+    
+    articles, days_found = build_rollup(period, limit=10)
+    if not days_found:
+        raise RuntimeError(f"No stored daily summaries found for the {period} roll-up")
+    
+    message = build_telegram_message(
+        articles,
+        heading=build_rollup_heading(period),
+        empty_text="No news stories were stored for this period.",
+    )
+    send_telegram_message(message)
+    
+    logger.info(f"Successfully sent {period} news to Telegram chat {TELEGRAM_CHAT_ID}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main function to fetch news and send Telegram message.
+    
+    Pass "weekly" or "monthly" as the first argument to send a roll-up
+    digest built from stored daily summaries instead of fetching news.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    period = args[0] if args else None
+    
+    if period and period not in PERIODS:
+        logger.error(
+            f"Unknown mode '{period}'. Use one of: {', '.join(PERIODS)}"
+        )
+        sys.exit(2)
+    
+    if period:
+        try:
+            send_rollup(period)
+        except Exception as e:
+            logger.error(f"Failed to send {period} news: {e}")
+            sys.exit(1)
+        return
+    
     logger.info("Starting daily Europe news Telegram bot...")
     
     try:
-        # Fetch articles
-        articles = fetch_top_europe_news(limit=10)
-        logger.info(f"Fetched {len(articles)} articles")
+        # Fetch a wider pool than we send, so roll-ups can see which stories
+        # many outlets cover
+        pool = fetch_top_europe_news(limit=SUMMARY_POOL_SIZE)
+        articles = pool[:10]
+        logger.info(f"Fetched {len(pool)} articles")
+        
+        # Store a coverage-scored summary of today's articles for weekly/monthly roll-ups
+        if pool:
+            try:
+                save_daily_summary(pool)
+            except Exception as e:
+                logger.warning(f"Could not store daily summary: {e}")
         
         # If no articles, try fallback with chat API
         fallback_overview = None
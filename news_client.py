@@ -6,6 +6,7 @@ from typing import Dict, List
 import requests
 
 from config import NEWS_API_BASE_URL, NEWS_API_KEY
+from rate_governor import RateLimitExceeded, governed_request
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,9 @@ def fetch_top_europe_news(limit: int = 10) -> List[Dict]:
 
     try:
         logger.info("Fetching European news from World News API...")
-        resp = requests.get(url, params=params, headers=headers, timeout=15)
+        resp = governed_request(
+            "worldnews", "GET", url, params=params, headers=headers, timeout=15
+        )
         resp.raise_for_status()
 
         data = resp.json()
@@ -68,6 +71,8 @@ def fetch_top_europe_news(limit: int = 10) -> List[Dict]:
         logger.error(
             f"HTTP error from World News API: {e} | body={resp.text[:300]}"
         )
+    except RateLimitExceeded as e:
+        logger.error(f"World News API quota exhausted: {e}")
     except requests.exceptions.RequestException as e:
         logger.error(f"Network error fetching news: {e}")
     except Exception as e:
@@ -0,0 +1,298 @@
+"""Client-side quota and rate governor shared by all upstream API clients."""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import requests
+
+from config import RATE_STATE_PATH
+
+logger = logging.getLogger(__name__)
+
+# Retries after a 429 before the response is handed back to the caller
+MAX_RETRIES = 3
+# Longest a request may be queued before giving up (keeps CI runs bounded)
+MAX_WAIT_SECONDS = 120.0
+# Upper bound for the adaptive concurrency window of a provider
+MAX_CONCURRENCY = 4
+# Backoff after a 429 that carries no Retry-After information
+DEFAULT_BACKOFF_SECONDS = 5.0
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """Raised when a provider's budget cannot be met within MAX_WAIT_SECONDS."""
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a duration header value into seconds.
+
+    Accepts plain seconds ("20", "1.5") and Go-style durations ("6m0s", "120ms").
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    factors = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    return sum(float(amount) * factors[unit] for amount, unit in parts)
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    """Parse a numeric header value, ignoring anything malformed."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _next_utc_midnight(now: float) -> float:
+    """Return the timestamp of the next UTC midnight after now."""
+    today = datetime.fromtimestamp(now, tz=timezone.utc).date()
+    midnight = datetime(today.year, today.month, today.day, tzinfo=timezone.utc)
+    return (midnight + timedelta(days=1)).timestamp()
+
+
+def _retry_after(response: requests.Response) -> float:
+    """Return how long to back off after a 429 response, in seconds."""
+    header = response.headers.get("Retry-After")
+    seconds = _parse_duration(header)
+    if seconds is None and header:
+        try:
+            seconds = parsedate_to_datetime(header).timestamp() - time.time()
+        except (TypeError, ValueError):
+            seconds = None
+
+    if seconds is None:
+        # Telegram reports the backoff in the JSON body instead of a header
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and isinstance(data.get("parameters"), dict):
+            seconds = _parse_float(str(data["parameters"].get("retry_after")))
+
+    return max(seconds, 0.0) if seconds is not None else DEFAULT_BACKOFF_SECONDS
+
+
+def _state_float(state: Dict, key: str) -> Optional[float]:
+    """Read a finite number from persisted state, or None if missing or invalid."""
+    value = state.get(key)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value) if math.isfinite(value) else None
+
+
+class ProviderBudget:
+    """Rate budget and adaptive concurrency window of a single provider."""
+
+    def __init__(self, name: str, state: Optional[Dict] = None):
+        # Persisted state may come from an older or corrupted file; ignore
+        # anything that is not a number instead of failing every request
+        state = state if isinstance(state, dict) else {}
+        self.name = name
+        self.limit = min(max(_state_float(state, "limit") or 1.0, 1.0), float(MAX_CONCURRENCY))
+        self.remaining = _state_float(state, "remaining")
+        self.reset_at = _state_float(state, "reset_at")
+        self.cooldown_until = _state_float(state, "cooldown_until") or 0.0
+        self.last_request_at = _state_float(state, "last_request_at") or 0.0
+        self.in_flight = 0
+
+    def to_dict(self) -> Dict:
+        """Return the persistent part of the budget."""
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_at": self.reset_at,
+            "cooldown_until": self.cooldown_until,
+            "last_request_at": self.last_request_at,
+        }
+
+    def wait_time(self, now: float) -> float:
+        """Return how long the next request has to wait, in seconds."""
+        wait = self.cooldown_until - now
+
+        if self.remaining is not None and self.reset_at and self.reset_at > now:
+            window = self.reset_at - now
+            if self.remaining <= 0:
+                wait = max(wait, window)
+            elif window <= MAX_WAIT_SECONDS:
+                # Spread the remaining budget evenly over the current window
+                interval = window / self.remaining
+                wait = max(wait, self.last_request_at + interval - now)
+
+        return max(wait, 0.0)
+
+    def update_from_response(self, response: requests.Response, now: float) -> None:
+        """Update the budget from rate-limit headers and the response status."""
+        headers = response.headers
+
+        # OpenAI style headers, then World News API quota points
+        remaining = _parse_float(headers.get("x-ratelimit-remaining-requests"))
+        reset = _parse_duration(headers.get("x-ratelimit-reset-requests"))
+        if remaining is None:
+            remaining = _parse_float(headers.get("X-API-Quota-Left"))
+
+        if remaining is not None:
+            self.remaining = remaining
+            # Quotas without an explicit reset are daily quotas
+            self.reset_at = now + reset if reset is not None else _next_utc_midnight(now)
+
+        if response.status_code == 429:
+            # Multiplicative decrease, then wait out the provider's backoff
+            self.limit = max(1.0, self.limit / 2)
+            self.cooldown_until = max(self.cooldown_until, now + _retry_after(response))
+        elif response.ok:
+            # Additive increase: roughly one extra slot per full window of successes
+            self.limit = min(float(MAX_CONCURRENCY), self.limit + 1.0 / self.limit)
+
+
+class RateGovernor:
+    """
+    Queue requests per provider so a run stays within each provider's limits.
+
+    Budgets are persisted to a JSON file so a new run starts from what the
+    previous run learned (e.g. an exhausted daily quota or a pending backoff).
+    """
+
+    def __init__(self, state_path: Optional[str] = None):
+        self.state_path = state_path or RATE_STATE_PATH
+        self._cond = threading.Condition()
+        self._budgets: Optional[Dict[str, ProviderBudget]] = None
+
+    def _load(self) -> Dict[str, ProviderBudget]:
+        """Load persisted budgets (once)."""
+        if self._budgets is None:
+            state: Dict = {}
+            if os.path.exists(self.state_path):
+                try:
+                    with open(self.state_path, encoding="utf-8") as f:
+                        state = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Could not read rate limit state {self.state_path}: {e}")
+            if not isinstance(state, dict):
+                logger.warning(f"Ignoring rate limit state {self.state_path}: not a JSON object")
+                state = {}
+            self._budgets = {}
+            for name, provider_state in state.items():
+                try:
+                    self._budgets[name] = ProviderBudget(name, provider_state)
+                except (TypeError, AttributeError, ValueError) as e:
+                    logger.warning(f"Ignoring rate limit state for {name}: {e}")
+                    self._budgets[name] = ProviderBudget(name)
+        return self._budgets
+
+    def _save(self) -> None:
+        """Persist all budgets. Failures are logged, never raised."""
+        state = {name: budget.to_dict() for name, budget in self._load().items()}
+        try:
+            directory = os.path.dirname(self.state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not store rate limit state {self.state_path}: {e}")
+
+    def _budget(self, provider: str) -> ProviderBudget:
+        budgets = self._load()
+        if provider not in budgets:
+            budgets[provider] = ProviderBudget(provider)
+        return budgets[provider]
+
+    def _acquire(self, budget: ProviderBudget, deadline: float) -> None:
+        """Block until the provider has budget and a free slot, or the deadline passes."""
+        while True:
+            now = time.time()
+            wait = budget.wait_time(now)
+            left = deadline - time.monotonic()
+            if wait > left:
+                raise RateLimitExceeded(
+                    f"{budget.name} rate budget exhausted, next request possible in {wait:.0f}s"
+                )
+
+            if wait <= 0 and budget.in_flight < int(budget.limit):
+                budget.in_flight += 1
+                budget.last_request_at = now
+                return
+
+            if wait > 0:
+                logger.info(f"Queueing {budget.name} request for {wait:.1f}s")
+            self._cond.wait(timeout=wait if wait > 0 else left)
+
+    def request(self, provider: str, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send an HTTP request within the provider's rate budget.
+
+        Requests are queued while the provider is cooling down or out of
+        concurrency slots, and retried after a 429 (up to MAX_RETRIES). The
+        total queueing time across all attempts is capped at MAX_WAIT_SECONDS.
+
+        Args:
+            provider: Provider name the budget is tracked under
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to requests.request
+
+        Returns:
+            The final response (possibly still a 429 once retries are used up)
+
+        Raises:
+            RateLimitExceeded: If the budget cannot be met within MAX_WAIT_SECONDS
+            requests.exceptions.RequestException: On network errors
+        """
+        deadline = time.monotonic() + MAX_WAIT_SECONDS
+        for attempt in range(MAX_RETRIES + 1):
+            with self._cond:
+                budget = self._budget(provider)
+                self._acquire(budget, deadline)
+
+            try:
+                response = requests.request(method, url, **kwargs)
+            except requests.exceptions.RequestException:
+                with self._cond:
+                    budget.in_flight -= 1
+                    self._cond.notify_all()
+                raise
+
+            with self._cond:
+                budget.in_flight -= 1
+                budget.update_from_response(response, time.time())
+                self._save()
+                self._cond.notify_all()
+
+            if response.status_code != 429 or attempt == MAX_RETRIES:
+                return response
+
+            logger.warning(
+                f"{provider} returned 429 (attempt {attempt + 1}/{MAX_RETRIES + 1}), "
+                f"concurrency now {int(budget.limit)}"
+            )
+
+        return response
+
+
+_governor = RateGovernor()
+
+
+def governed_request(provider: str, method: str, url: str, **kwargs) -> requests.Response:
+    """Send an HTTP request through the shared rate governor."""
+    return _governor.request(provider, method, url, **kwargs)
@@ -0,0 +1,128 @@
+"""Weekly and monthly roll-up digests built from stored daily summaries."""
+
+import logging
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from digest_store import load_daily_summary, same_story, title_words
+
+logger = logging.getLogger(__name__)
+
+PERIODS = ("weekly", "monthly")
+
+
+def rollup_range(period: str, today: Optional[date] = None) -> Tuple[date, date]:
+    """
+    Return the first and last day covered by a roll-up.
+
+    Weekly roll-ups cover the 7 days ending today, monthly roll-ups cover the
+    previous calendar month (so the edition sent on the 1st covers last month).
+
+    Raises:
+        ValueError: If the period is unknown
+    """
+    today = today or date.today()
+    if period == "weekly":
+        return today - timedelta(days=6), today
+    if period == "monthly":
+        end = today.replace(day=1) - timedelta(days=1)
+        return end.replace(day=1), end
+    raise ValueError(
+        f"Unknown roll-up period '{period}'. Expected one of: {', '.join(PERIODS)}"
+    )
+
+
+def merge_summaries(summaries: List[Dict]) -> List[Dict]:
+    """
+    Merge daily summaries into a single ranked list of stories.
+
+    Stories are matched across days by URL or against the headline that first
+    introduced them (see same_story) and their coverage scores are added up, so a story reported by many outlets
+    on several days ranks above a single one-day article.
+
+    Args:
+        summaries: Daily summary dicts, oldest first
+
+    Returns:
+        Stories sorted by total score (highest first), each with a "days" count
+        of the distinct days it appeared on
+    """
+    merged: List[Dict] = []
+    for summary in summaries:
+        day = summary.get("date")
+        for story in summary.get("stories", []):
+            url = story.get("url")
+            words = set(story.get("words") or title_words(story.get("title") or ""))
+
+            entry = next(
+                (
+                    e for e in merged
+                    if (url and url == e.get("url")) or same_story(e["words"], words)
+                ),
+                None,
+            )
+            if entry:
+                entry["score"] += story.get("score", 0)
+                entry["dates"].add(day)
+                # Keep the most recent wording of the story, but keep matching
+                # against the first headline's words so stories cannot drift
+                entry["title"] = story.get("title") or entry["title"]
+                entry["description"] = story.get("description") or entry["description"]
+                entry["url"] = url or entry["url"]
+            else:
+                merged.append({**story, "words": words, "dates": {day}})
+
+    for entry in merged:
+        entry["days"] = len(entry.pop("dates"))
+
+    ranked = sorted(
+        merged,
+        key=lambda s: (s["score"], s["days"], s.get("published_at", "")),
+        reverse=True,
+    )
+    return [{k: v for k, v in s.items() if k != "words"} for s in ranked]
+
+
+def build_rollup(
+    period: str,
+    today: Optional[date] = None,
+    limit: int = 10,
+    store_dir: Optional[str] = None,
+) -> Tuple[List[Dict], int]:
+    """
+    Build the top stories for a weekly or monthly digest.
+
+    Args:
+        period: "weekly" or "monthly"
+        today: Day the roll-up is built on (defaults to today)
+        limit: Maximum number of stories to return
+        store_dir: Optional directory (defaults to DIGEST_STORE_DIR from config)
+
+    Returns:
+        Tuple of (top stories, number of days that had a stored summary)
+
+    Raises:
+        ValueError: If the period is unknown
+    """
+    start, end = rollup_range(period, today)
+    num_days = (end - start).days + 1
+
+    summaries: List[Dict] = []
+    for offset in range(num_days):
+        summary = load_daily_summary(start + timedelta(days=offset), store_dir)
+        if summary:
+            summaries.append(summary)
+
+    logger.info(f"Building {period} roll-up from {len(summaries)}/{num_days} daily summaries")
+    return merge_summaries(summaries)[:limit], len(summaries)
+
+
+def build_rollup_heading(period: str, today: Optional[date] = None) -> str:
+    """
+    Build the heading for a roll-up digest.
+
+    Returns:
+        Heading like "Weekly Europe News – 2024-01-09 to 2024-01-15"
+    """
+    start, end = rollup_range(period, today)
+    return f"{period.capitalize()} Europe News – {start.isoformat()} to {end.isoformat()}"
@@ -5,16 +5,23 @@ from typing import Dict, List, Optional
 
 
 def build_telegram_message(
-    articles: List[Dict], fallback_overview: Optional[str] = None
+    articles: List[Dict],
+    fallback_overview: Optional[str] = None,
+    heading: Optional[str] = None,
+    empty_text: Optional[str] = None,
 ) -> str:
     """
     Build a Telegram message from news articles.
     Plain text only (no HTML), so Telegram can't choke on formatting.
+    An optional heading and empty-state text replace the daily ones
+    (e.g. for weekly roll-ups).
     """
-    today = datetime.now().strftime("%Y-%m-%d")
+    if not heading:
+        today = datetime.now().strftime("%Y-%m-%d")
+        heading = f"Daily Europe News – {today}"
 
     lines: List[str] = []
-    lines.append(f"📰 Daily Europe News – {today}")
+    lines.append(f"📰 {heading}")
     lines.append("")
 
     if not articles:
@@ -24,7 +31,8 @@ def build_telegram_message(
             lines.append(fallback_overview)
         else:
             lines.append(
-                "No news articles were available today. Please check back tomorrow."
+                empty_text
+                or "No news articles were available today. Please check back tomorrow."
             )
 
         msg = "\n".join(lines)
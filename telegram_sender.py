@@ -3,9 +3,8 @@
 import logging
 from typing import Optional
 
-import requests
-
 from config import TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID
+from rate_governor import governed_request
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +39,7 @@ def send_telegram_message(message: str, parse_mode: Optional[str] = None) -> Non
 
     try:
         logger.info(f"Sending Telegram message to chat {TELEGRAM_CHAT_ID}...")
-        resp = requests.post(url, json=payload, timeout=15)
+        resp = governed_request("telegram", "POST", url, json=payload, timeout=15)
         resp.raise_for_status()
         data = resp.json()
         if not data.get("ok", False):